@@ -3,7 +3,11 @@ import random
 import sys
 import math
 import os
+from collections import OrderedDict
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
 
 # Initialize Pygame
@@ -29,12 +33,149 @@ GREEN = (0, 255, 0)
 SKY_BLUE = (135, 206, 235)
 
 # Create the game window
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+# SCALED lets SDL present through its GPU renderer; vsync needs SCALED (or OpenGL)
+try:
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                     pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+except pygame.error:
+    # vsync isn't available on every driver; fall back to an unsynced window
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                     pygame.SCALED | pygame.DOUBLEBUF)
 pygame.display.set_caption('Flappy Bird Clone')
+
+
+def _flip_waits_for_vsync():
+    # vsync=1 is only a request: SDL may fall back to a software renderer (which
+    # drops SCALED) or ignore it. Check the window we got, then confirm flip()
+    # actually blocks; a synced flip takes >= ~4 ms even at 240 Hz.
+    if not screen.get_flags() & pygame.SCALED:
+        return False
+    screen.fill(SKY_BLUE)
+    pygame.display.flip()  # Warm-up; the first present can be slow for other reasons
+    start = time.perf_counter()
+    for _ in range(5):
+        pygame.display.flip()
+    return (time.perf_counter() - start) / 5 >= 0.003
+
+
+FLIP_WAITS_FOR_VSYNC = _flip_waits_for_vsync()
 clock = pygame.time.Clock()
 
-# Cache a small font to avoid recreating it every frame (performance)
+# Cache fonts to avoid recreating them every frame or on every restart (performance)
 SMALL_FONT = pygame.font.Font(None, 20)
+MEDIUM_FONT = pygame.font.Font(None, 24)
+LARGE_FONT = pygame.font.Font(None, 36)
+
+# Cache rendered text surfaces (LRU) since most HUD/shop text is unchanged between frames.
+# Keyed on the font object, so pass the shared module-level fonts above.
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_SIZE = 128
+
+
+def render_cached(font, text, color):
+    key = (font, text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+        if len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
+
+
+# Background writer so SQLite commits never block the game loop.
+class StorageWorker(threading.Thread):
+    def __init__(self, db_path):
+        super().__init__(daemon=True)
+        self.queue = queue.SimpleQueue()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA synchronous=OFF')
+        self.conn.execute('PRAGMA busy_timeout=2000')
+        # Write items queued (main thread) vs committed (worker thread); each
+        # counter has a single writer, so flush() can compare them without a lock
+        self._queued = 0
+        self._committed = 0
+
+    def run(self):
+        running = True
+        while running:
+            waiters = []
+            writes = []
+            done = 0
+            item = self.queue.get()
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif isinstance(item, list):
+                    writes.extend(item)
+                    done += 1
+                else:
+                    writes.append(item)
+                    done += 1
+                # Someone is waiting on a flush/stop: commit now instead of coalescing
+                if waiters or not running:
+                    break
+                # Coalesce whatever else arrives shortly after into one transaction
+                try:
+                    item = self.queue.get(timeout=0.05)
+                except queue.Empty:
+                    break
+            self._commit(writes)
+            self._committed += done
+            for event in waiters:
+                event.set()
+        self.conn.close()
+
+    def _commit(self, writes):
+        if not writes:
+            return
+        try:
+            with self.conn:
+                # Group consecutive writes using the same statement into executemany
+                i = 0
+                while i < len(writes):
+                    sql = writes[i][0]
+                    j = i
+                    while j < len(writes) and writes[j][0] == sql:
+                        j += 1
+                    self.conn.executemany(sql, [params for _, params in writes[i:j]])
+                    i = j
+        except sqlite3.Error:
+            # One bad statement rolls back the whole batch; retry the writes one at
+            # a time so only the failing ones are dropped
+            for sql, params in writes:
+                try:
+                    with self.conn:
+                        self.conn.execute(sql, params)
+                except sqlite3.Error:
+                    # DB failed/unavailable; skip this write rather than crash the game
+                    pass
+
+    def put(self, sql, params):
+        self._queued += 1
+        self.queue.put((sql, params))
+
+    def put_many(self, sql, rows):
+        # Enqueue as one item so all rows are guaranteed to share a transaction
+        self._queued += 1
+        self.queue.put([(sql, params) for params in rows])
+
+    def flush(self, timeout=1.0):
+        # Block until everything queued so far has been committed. If the worker
+        # has died (or is stuck) don't freeze the game; reads may just be stale.
+        if self._committed == self._queued or not self.is_alive():
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+
+    def stop(self, timeout=2.0):
+        self.queue.put(None)
+        self.join(timeout)
 
 
 # Persistence layer using SQLite stored in a per-user app data directory.
@@ -44,6 +185,9 @@ class Persistence:
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         self.conn = sqlite3.connect(self.db_path)
         self._init_tables()
+        # Writes go through the worker; reads stay on self.conn (WAL keeps them non-blocking)
+        self.writer = StorageWorker(self.db_path)
+        self.writer.start()
 
     def _get_db_path(self):
         # Use OS-specific app data location so each user has their own DB
@@ -58,46 +202,59 @@ class Persistence:
         return os.path.join(base, 'game.db')
 
     def _init_tables(self):
-        c = self.conn.cursor()
-        c.execute('''CREATE TABLE IF NOT EXISTS state (
+        # WAL + synchronous=OFF: commits never wait on fsync. The tradeoff is that an
+        # OS crash or power loss can corrupt game.db, not just lose the last write.
+        # (synchronous=NORMAL is corruption-safe in WAL mode and, since commits run
+        # on the StorageWorker thread, wouldn't cost frame time either.)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=OFF')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA busy_timeout=2000')
+        self.conn.execute('PRAGMA cache_size=-2000')
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS state (
                         key TEXT PRIMARY KEY,
                         value TEXT
                     )''')
-        c.execute('''CREATE TABLE IF NOT EXISTS owned_skins (
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS owned_skins (
                         skin TEXT PRIMARY KEY
                     )''')
         self.conn.commit()
 
     def get_state(self, key, default=None):
-        c = self.conn.cursor()
-        c.execute('SELECT value FROM state WHERE key=?', (key,))
-        row = c.fetchone()
+        self.writer.flush()
+        row = self.conn.execute('SELECT value FROM state WHERE key=?', (key,)).fetchone()
         return default if row is None else row[0]
 
     def set_state(self, key, value):
-        c = self.conn.cursor()
-        c.execute('INSERT OR REPLACE INTO state(key, value) VALUES(?, ?)', (key, str(value)))
-        self.conn.commit()
+        self.writer.put('INSERT OR REPLACE INTO state(key, value) VALUES(?, ?)', (key, str(value)))
 
     def add_owned_skin(self, skin_name):
-        c = self.conn.cursor()
-        c.execute('INSERT OR IGNORE INTO owned_skins(skin) VALUES(?)', (skin_name,))
-        self.conn.commit()
+        self.writer.put('INSERT OR IGNORE INTO owned_skins(skin) VALUES(?)', (skin_name,))
+
+    def add_owned_skins(self, skin_names):
+        self.writer.put_many('INSERT OR IGNORE INTO owned_skins(skin) VALUES(?)',
+                             [(name,) for name in skin_names])
 
     def get_owned_skins(self):
-        c = self.conn.cursor()
-        c.execute('SELECT skin FROM owned_skins')
-        return {row[0] for row in c.fetchall()}
+        self.writer.flush()
+        return {row[0] for row in self.conn.execute('SELECT skin FROM owned_skins')}
 
     def close(self):
         try:
+            # Let the worker commit pending writes before closing
+            self.writer.stop()
             self.conn.close()
         except:
             pass
 
 
 # Create a global persistence instance
-persistence = Persistence()
+try:
+    persistence = Persistence()
+except:
+    # DB unavailable or corrupt; every persistence call is wrapped in try/except,
+    # so with no instance the game simply runs without saving
+    persistence = None
 
 class Bird:
     # Available skins with their prices
@@ -166,6 +323,9 @@ class Bird:
             'price': 300
         }
     }
+    # Color-only view of each skin, built once (shared read-only by all birds)
+    _SKIN_COLORS = {name: {k: v for k, v in d.items() if k != 'price'}
+                    for name, d in SKINS.items()}
 
     def __init__(self):
         self.x = WINDOW_WIDTH // 3
@@ -182,8 +342,7 @@ class Bird:
     def save_owned_skins(self):
         # Persist owned skins to the DB
         try:
-            for s in self.owned_skins:
-                persistence.add_owned_skin(s)
+            persistence.add_owned_skins(self.owned_skins)
         except:
             pass
 
@@ -217,8 +376,40 @@ class Bird:
             self.save_current_skin()
 
     def apply_skin(self, skin_name):
-        self.colors = self.SKINS[skin_name].copy()
-        del self.colors['price']
+        self.colors = self._SKIN_COLORS[skin_name]
+        self._build_sprites()
+
+    def _build_sprites(self):
+        # Draw the bird once and pre-rotate it in 5 degree steps over the
+        # angle range used by update() (-70..20), so draw() is a single blit
+        base = pygame.Surface((self.size, self.size), pygame.SRCALPHA).convert_alpha()
+
+        # Draw body (circle)
+        pygame.draw.circle(base, self.colors['body'],
+                         (self.size // 2, self.size // 2),
+                         self.size // 2 - 2)
+
+        # Draw wing
+        wing_points = [(self.size // 2 - 2, self.size // 2),
+                      (self.size // 4, self.size // 2 + 5),
+                      (self.size // 2 - 2, self.size // 2 + 10)]
+        pygame.draw.polygon(base, self.colors['wing'], wing_points)
+
+        # Draw beak
+        beak_points = [(self.size * 3 // 4, self.size // 2 - 2),
+                      (self.size - 2, self.size // 2),
+                      (self.size * 3 // 4, self.size // 2 + 2)]
+        pygame.draw.polygon(base, self.colors['beak'], beak_points)
+
+        # Draw eye
+        pygame.draw.circle(base, self.colors['eye'],
+                         (self.size * 5 // 8, self.size // 2 - 2),
+                         2)
+
+        self._rotated_sprites = {}
+        for ang in range(-70, 25, 5):
+            self._rotated_sprites[ang] = pygame.transform.rotate(base, ang)
+        self._cached_bucket = None  # Force draw() to pick up the new sprites
 
     def purchase_skin(self, skin_name, coins):
         if (skin_name in self.SKINS and 
@@ -256,88 +447,85 @@ class Bird:
 # a proper game over when the bird touches the edges.
 
     def draw(self):
-        # Create a surface for the bird
-        bird_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        
-        # Draw body (circle)
-        pygame.draw.circle(bird_surface, self.colors['body'], 
-                         (self.size // 2, self.size // 2), 
-                         self.size // 2 - 2)
-        
-        # Draw wing
-        wing_points = [(self.size // 2 - 2, self.size // 2),
-                      (self.size // 4, self.size // 2 + 5),
-                      (self.size // 2 - 2, self.size // 2 + 10)]
-        pygame.draw.polygon(bird_surface, self.colors['wing'], wing_points)
-        
-        # Draw beak
-        beak_points = [(self.size * 3 // 4, self.size // 2 - 2),
-                      (self.size - 2, self.size // 2),
-                      (self.size * 3 // 4, self.size // 2 + 2)]
-        pygame.draw.polygon(bird_surface, self.colors['beak'], beak_points)
-        
-        # Draw eye
-        pygame.draw.circle(bird_surface, self.colors['eye'],
-                         (self.size * 5 // 8, self.size // 2 - 2),
-                         2)
-        
-        # Rotate the bird surface
-        rotated_bird = pygame.transform.rotate(bird_surface, self.angle)
-        
-        # Calculate position adjustment for rotation
-        new_rect = rotated_bird.get_rect(center=(self.x + self.size // 2, 
-                                                self.y + self.size // 2))
-        
+        # Snap to the nearest pre-rotated sprite; the angle sits at 20 or -70
+        # most of the time, so only redo the lookup when the bucket changes
+        bucket = max(-70, min(20, int(round(self.angle / 5)) * 5))
+        if bucket != self._cached_bucket:
+            self._cached_bucket = bucket
+            self._cached_surf = self._rotated_sprites[bucket]
+            # Calculate position adjustment for rotation (keep the sprite centered)
+            self._cached_offset = (self.size // 2 - self._cached_surf.get_width() // 2,
+                                   self.size // 2 - self._cached_surf.get_height() // 2)
+
         # Draw the rotated bird
-        screen.blit(rotated_bird, new_rect.topleft)
+        screen.blit(self._cached_surf, (self.x + self._cached_offset[0],
+                                               self.y + self._cached_offset[1]))
 
 class Pipe:
+    # Fixed attribute layout: smaller objects and faster attribute access in the update loop
+    __slots__ = ('gap_y', 'x', 'width', 'passed', 'edge_width',
+                 '_top_surf', '_bot_surf', '_bottom_y')
+
     def __init__(self):
         self.gap_y = random.randint(150, WINDOW_HEIGHT - 150)
         self.x = WINDOW_WIDTH
         self.width = 80
         self.passed = False
         self.edge_width = 10  # Width of the pipe edge
+        self._build_surfaces()
 
-    def update(self):
-        self.x -= PIPE_SPEED
-        return self.x > -self.width
-
-    def draw(self):
+    def _build_surfaces(self):
+        # gap_y is fixed per pipe, so draw both halves once and just blit them
         # Colors for more realistic pipes
         pipe_color = (40, 100, 40)  # Darker green
         edge_color = (60, 140, 60)  # Lighter green for edges
-        
-        # Draw top pipe
+        surf_width = self.width + self.edge_width * 2
+
+        # Top pipe, cap at the bottom
         top_height = self.gap_y - PIPE_GAP // 2
-        pygame.draw.rect(screen, pipe_color, (self.x, 0, self.width, top_height))
-        pygame.draw.rect(screen, edge_color, (self.x - self.edge_width, top_height - 20, 
-                                            self.width + self.edge_width * 2, 20))
-        
-        # Draw bottom pipe
+        self._top_surf = pygame.Surface((surf_width, top_height), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(self._top_surf, pipe_color, (self.edge_width, 0, self.width, top_height))
+        pygame.draw.rect(self._top_surf, edge_color, (0, top_height - 20, surf_width, 20))
+
+        # Bottom pipe, cap at the top
         bottom_y = self.gap_y + PIPE_GAP // 2
         bottom_height = WINDOW_HEIGHT - bottom_y
-        pygame.draw.rect(screen, pipe_color, (self.x, bottom_y, self.width, bottom_height))
-        pygame.draw.rect(screen, edge_color, (self.x - self.edge_width, bottom_y, 
-                                            self.width + self.edge_width * 2, 20))
-        
+        self._bottom_y = bottom_y
+        self._bot_surf = pygame.Surface((surf_width, bottom_height), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(self._bot_surf, pipe_color, (self.edge_width, 0, self.width, bottom_height))
+        pygame.draw.rect(self._bot_surf, edge_color, (0, 0, surf_width, 20))
+
         # Add pipe details (vertical lines for texture)
         for i in range(3):
-            line_x = self.x + (self.width * (i + 1) // 4)
-            # Top pipe lines
-            pygame.draw.line(screen, edge_color, (line_x, 0), (line_x, top_height), 2)
-            # Bottom pipe lines
-            pygame.draw.line(screen, edge_color, (line_x, bottom_y), 
-                           (line_x, bottom_y + bottom_height), 2)
+            line_x = self.edge_width + (self.width * (i + 1) // 4)
+            pygame.draw.line(self._top_surf, edge_color, (line_x, 0), (line_x, top_height), 2)
+            pygame.draw.line(self._bot_surf, edge_color, (line_x, 0), (line_x, bottom_height), 2)
 
-    def check_collision(self, bird):
-        bird_rect = pygame.Rect(bird.x, bird.y, bird.size, bird.size)
+    def update(self):
+        self.x -= PIPE_SPEED
+        return self.x > -self.width
+
+    def draw(self):
+        screen.blit(self._top_surf, (self.x - self.edge_width, 0))
+        screen.blit(self._bot_surf, (self.x - self.edge_width, self._bottom_y))
+
+    def check_collision(self, bird_rect):
+        # Most pipes aren't horizontally level with the bird; skip the Rect work for them
+        if bird_rect.right <= self.x or bird_rect.left >= self.x + self.width:
+            return False
         top_pipe = pygame.Rect(self.x, 0, self.width, self.gap_y - PIPE_GAP // 2)
         bottom_pipe = pygame.Rect(self.x, self.gap_y + PIPE_GAP // 2, 
                                 self.width, WINDOW_HEIGHT - (self.gap_y + PIPE_GAP // 2))
         return bird_rect.colliderect(top_pipe) or bird_rect.colliderect(bottom_pipe)
 
+# One full sine period in 256 steps; coins bob by indexing this with an integer phase
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+
+
 class Coin:
+    __slots__ = ('x', 'y', 'radius', 'is_special', 'value', 'color', 'glow_color',
+                 'collected', 'bob_range', 'bob_step', 'start_y', 'phase', 'glow_size')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -348,23 +536,23 @@ class Coin:
         self.glow_color = (255, 182, 193) if self.is_special else (255, 228, 181)  # Lighter version for glow
         self.collected = False
         self.bob_range = 20  # Pixels to move up and down
-        self.bob_speed = 0.05
+        self.bob_step = round(0.05 / (2 * math.pi) * 256)  # ~0.05 rad per frame in LUT steps
         self.start_y = y
-        self.time = random.random() * 6.28  # Random start position in the bob cycle
+        self.phase = random.randrange(256)  # Random start position in the bob cycle
         self.glow_size = 0  # For pulsing effect
 
     def update(self):
         # Move left at the same speed as pipes
         self.x -= PIPE_SPEED
         # Bob up and down
-        self.time += self.bob_speed
-        self.y = self.start_y + math.sin(self.time) * self.bob_range
+        self.phase = (self.phase + self.bob_step) & 255
+        self.y = self.start_y + _SIN_LUT[self.phase] * self.bob_range
         # Keep coin if it's still on screen
         return self.x > -self.radius * 2
 
     def draw(self):
         # Update glow size for pulsing effect
-        self.glow_size = abs(math.sin(self.time * 2)) * 4
+        self.glow_size = abs(_SIN_LUT[(self.phase * 2) & 255]) * 4
 
         # Draw glow effect
         if self.is_special:
@@ -376,20 +564,25 @@ class Coin:
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
         
         # Draw value (reuse cached SMALL_FONT)
-        text = SMALL_FONT.render(str(self.value), True, BLACK)
+        text = render_cached(SMALL_FONT, str(self.value), BLACK)
         text_rect = text.get_rect(center=(int(self.x), int(self.y)))
         screen.blit(text, text_rect)
 
     def check_collision(self, bird):
-        bird_center = (bird.x + bird.size // 2, bird.y + bird.size // 2)
-        distance = ((bird_center[0] - self.x) ** 2 + (bird_center[1] - self.y) ** 2) ** 0.5
-        return distance < self.radius + bird.size // 2
+        half = bird.size // 2
+        r = self.radius + half
+        dx = bird.x + half - self.x
+        dy = bird.y + half - self.y
+        # Cheap bounding-box reject before the squared-distance test
+        if dx > r or dx < -r or dy > r or dy < -r:
+            return False
+        return dx * dx + dy * dy < r * r
 
 class Shop:
     def __init__(self, bird):
         self.bird = bird
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = LARGE_FONT
+        self.small_font = MEDIUM_FONT
         self.active = False
         self.coins = 0
         self.button_height = 50
@@ -398,6 +591,19 @@ class Shop:
         self.scroll_offset = 0
         self.scroll_speed = 20
         self.max_visible_items = 6
+        self._skin_names = tuple(self.bird.SKINS)  # Button order, for click hit-testing
+        # The exit button never changes, so render it and compute its rects once
+        self._exit_text = self.font.render('Back to Game', True, WHITE).convert_alpha()
+        self._exit_rect = self._exit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
+        self._exit_click_rect = self._exit_rect.inflate(20, 10)
+        # Reusable surfaces so drawing the shop doesn't allocate every frame
+        self._overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._overlay.fill((0, 0, 0))
+        self._overlay.set_alpha(128)
+        content_height = (len(self.bird.SKINS) * (self.button_height + self.margin))
+        self._scroll_surface = pygame.Surface((WINDOW_WIDTH, content_height), pygame.SRCALPHA).convert_alpha()
+        self._viewport = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT - 150), pygame.SRCALPHA).convert_alpha()
+        self._scroll_state = None  # State the scroll surface was last rendered for
         self.load_coins()
 
     def save_coins(self):
@@ -423,22 +629,17 @@ class Shop:
             return
 
         # Draw semi-transparent background
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
 
-        # Create a surface for the scrollable content
-        content_height = (len(self.bird.SKINS) * (self.button_height + self.margin))
-        scroll_surface = pygame.Surface((WINDOW_WIDTH, content_height), pygame.SRCALPHA)
+        content_height = self._scroll_surface.get_height()
 
         # Draw shop title
-        title = self.font.render('SHOP', True, WHITE)
+        title = render_cached(self.font, 'SHOP', WHITE)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         screen.blit(title, title_rect)
 
         # Draw coins
-        coins_text = self.font.render(f'Coins: {self.coins}', True, (255, 215, 0))
+        coins_text = render_cached(self.font, f'Coins: {self.coins}', (255, 215, 0))
         coins_rect = coins_text.get_rect(topleft=(20, 20))
         screen.blit(coins_text, coins_rect)
 
@@ -456,9 +657,26 @@ class Shop:
                 (WINDOW_WIDTH - 10, WINDOW_HEIGHT - 100)
             ])
 
-        # Create a viewport surface
-        viewport = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT - 150), pygame.SRCALPHA)
-        
+        # Button colors only change on purchase/equip, so re-render the
+        # scrollable content only when that state changes
+        state = (self.bird.current_skin, frozenset(self.bird.owned_skins), self.coins)
+        if state != self._scroll_state:
+            self._render_skin_buttons()
+            self._scroll_state = state
+
+        # Draw the visible portion of the scroll surface
+        self._viewport.fill((0, 0, 0, 0))
+        self._viewport.blit(self._scroll_surface, (0, -self.scroll_offset))
+        screen.blit(self._viewport, (0, 100))
+
+        # Draw exit button
+        pygame.draw.rect(screen, (255, 0, 0), self._exit_click_rect)
+        screen.blit(self._exit_text, self._exit_rect)
+
+    def _render_skin_buttons(self):
+        scroll_surface = self._scroll_surface
+        scroll_surface.fill((0, 0, 0, 0))
+
         # Draw skin options
         y_pos = 0
         for skin_name, skin_data in self.bird.SKINS.items():
@@ -468,7 +686,7 @@ class Shop:
                 self.button_width,
                 self.button_height
             )
-            
+
             # Different colors for owned/selected/locked skins
             if skin_name == self.bird.current_skin:
                 color = (0, 255, 0, 128)  # Green for selected
@@ -484,27 +702,17 @@ class Shop:
                 text_color = (200, 200, 200)
 
             pygame.draw.rect(scroll_surface, color, button_rect)
-            
+
             # Draw skin name and price
-            name_text = self.font.render(skin_name.replace('_', ' ').title(), True, text_color)
-            price_text = self.small_font.render(f'Price: {skin_data["price"]} coins', True, text_color)
-            
+            name_text = render_cached(self.font, skin_name.replace('_', ' ').title(), text_color)
+            price_text = render_cached(self.small_font, f'Price: {skin_data["price"]} coins', text_color)
+
             scroll_surface.blit(name_text, (button_rect.centerx - name_text.get_width() // 2,
                                           button_rect.y + 5))
             scroll_surface.blit(price_text, (button_rect.centerx - price_text.get_width() // 2,
                                            button_rect.y + 30))
-            
-            y_pos += self.button_height + self.margin
-
-        # Draw the visible portion of the scroll surface
-        viewport.blit(scroll_surface, (0, -self.scroll_offset))
-        screen.blit(viewport, (0, 100))
 
-        # Draw exit button
-        exit_text = self.font.render('Back to Game', True, WHITE)
-        exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
-        pygame.draw.rect(screen, (255, 0, 0), exit_rect.inflate(20, 10))
-        screen.blit(exit_text, exit_rect)
+            y_pos += self.button_height + self.margin
 
     def handle_events(self, event):
         if not self.active:
@@ -530,43 +738,29 @@ class Shop:
         # Adjust position for scroll
         adjusted_y = pos[1] + self.scroll_offset - 100  # 100 is the top margin
 
-        # Check skin buttons
-        y_pos = 0
-        for skin_name, skin_data in self.bird.SKINS.items():
-            button_rect = pygame.Rect(
-                (WINDOW_WIDTH - self.button_width) // 2,
-                y_pos,
-                self.button_width,
-                self.button_height
-            )
-            
-            # Adjust the rect for the current scroll position
-            screen_rect = pygame.Rect(
-                button_rect.x,
-                button_rect.y - self.scroll_offset + 100,
-                button_rect.width,
-                button_rect.height
-            )
-            
-            if screen_rect.collidepoint(pos):
-                if skin_name in self.bird.owned_skins:
-                    # If owned, just equip it
+        # Check skin buttons: they're equally sized and evenly stacked, so
+        # the row index follows directly from the click position
+        stride = self.button_height + self.margin
+        idx = adjusted_y // stride
+        button_x = (WINDOW_WIDTH - self.button_width) // 2
+        if (adjusted_y >= 0 and idx < len(self._skin_names) and
+                adjusted_y - idx * stride < self.button_height and
+                button_x <= pos[0] < button_x + self.button_width):
+            skin_name = self._skin_names[idx]
+            skin_data = self.bird.SKINS[skin_name]
+            if skin_name in self.bird.owned_skins:
+                # If owned, just equip it
+                self.bird.set_skin(skin_name)
+            elif skin_data['price'] <= self.coins:
+                # If not owned and can afford, purchase and equip
+                if self.bird.purchase_skin(skin_name, self.coins):
+                    self.coins -= skin_data['price']
                     self.bird.set_skin(skin_name)
-                elif skin_data['price'] <= self.coins:
-                    # If not owned and can afford, purchase and equip
-                    if self.bird.purchase_skin(skin_name, self.coins):
-                        self.coins -= skin_data['price']
-                        self.bird.set_skin(skin_name)
-                        self.save_coins()
-                return True
-            
-            y_pos += self.button_height + self.margin
+                    self.save_coins()
+            return True
 
-        # Check exit button (match the drawn button rect so clicks line up)
-        exit_text = self.font.render('Back to Game', True, WHITE)
-        exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
-        click_rect = exit_rect.inflate(20, 10)
-        if click_rect.collidepoint(pos):
+        # Check exit button (same rect as the drawn button so clicks line up)
+        if self._exit_click_rect.collidepoint(pos):
             self.active = False
             return True
         
@@ -582,10 +776,13 @@ class Game:
         self.last_pipe = pygame.time.get_ticks()
         self.last_coin = pygame.time.get_ticks()
         self.game_over = False
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = LARGE_FONT
+        self.small_font = MEDIUM_FONT
         self.shop = Shop(self.bird)
         self.load_saved_coins()
+        # Coin pickups only mark coins dirty; they are written at most once per second
+        self._coins_dirty = False
+        self._last_save_ms = 0
 
     def load_high_score(self):
         try:
@@ -618,6 +815,8 @@ class Game:
             self.shop.coins = 0
 
     def save_coins(self):
+        self._coins_dirty = False
+        self._last_save_ms = pygame.time.get_ticks()
         try:
             persistence.set_state('coins', int(self.shop.coins))
         except:
@@ -632,6 +831,8 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     if self.game_over:
+                        if self._coins_dirty:
+                            self.save_coins()  # Reset reloads coins from the DB
                         self.__init__()  # Reset game
                     elif not self.shop.active:
                         self.bird.flap()
@@ -663,11 +864,9 @@ class Game:
 
             # Create new coins
             if now - self.last_coin > COIN_FREQUENCY:
-                # Find the rightmost pipe
-                rightmost_pipe = None
-                for pipe in self.pipes:
-                    if not rightmost_pipe or pipe.x > rightmost_pipe.x:
-                        rightmost_pipe = pipe
+                # Pipes spawn at the right edge and all move left at the same
+                # speed, so the most recently added one is the rightmost
+                rightmost_pipe = self.pipes[-1] if self.pipes else None
 
                 # Position coin near pipe gap if there's a pipe, otherwise in a safe zone
                 if rightmost_pipe and rightmost_pipe.x < WINDOW_WIDTH - 100:
@@ -683,6 +882,7 @@ class Game:
                 self.last_coin = now
 
             # Update pipes and check collisions
+            bird_rect = pygame.Rect(self.bird.x, self.bird.y, self.bird.size, self.bird.size)
             surviving_pipes = []
             for pipe in self.pipes:
                 if pipe.update():
@@ -690,7 +890,7 @@ class Game:
                     if not pipe.passed and pipe.x < self.bird.x:
                         self.score += 1
                         pipe.passed = True
-                    if pipe.check_collision(self.bird):
+                    if pipe.check_collision(bird_rect):
                         self.game_over = True
                         self.save_high_score()
             self.pipes = surviving_pipes
@@ -703,11 +903,14 @@ class Game:
                         coin.collected = True
                         # Use coin.value so special coins give 10
                         self.shop.coins += coin.value
-                        self.save_coins()
+                        self._coins_dirty = True
                     else:
                         surviving_coins.append(coin)
             self.coins = surviving_coins
 
+            if self._coins_dirty and pygame.time.get_ticks() - self._last_save_ms > 1000:
+                self.save_coins()
+
     def draw(self):
         screen.fill(SKY_BLUE)
         
@@ -720,20 +923,20 @@ class Game:
                 coin.draw()
 
             # Draw score, high score, and coins
-            score_text = self.font.render(f'Score: {self.score}', True, WHITE)
-            high_score_text = self.small_font.render(f'High Score: {self.high_score}', True, (255, 215, 0))
-            coin_text = self.font.render(f'Coins: {self.shop.coins}', True, (255, 215, 0))
+            score_text = render_cached(self.font, f'Score: {self.score}', WHITE)
+            high_score_text = render_cached(self.small_font, f'High Score: {self.high_score}', (255, 215, 0))
+            coin_text = render_cached(self.font, f'Coins: {self.shop.coins}', (255, 215, 0))
             
             screen.blit(score_text, (10, 10))
             screen.blit(high_score_text, (10, 45))
             screen.blit(coin_text, (10, 75))
 
             if not self.game_over:
-                shop_text = self.font.render('Press S for Shop', True, WHITE)
+                shop_text = render_cached(self.font, 'Press S for Shop', WHITE)
                 screen.blit(shop_text, (WINDOW_WIDTH - shop_text.get_width() - 10, 10))
 
             if self.game_over:
-                game_over_text = self.font.render('Game Over! Space to restart', True, WHITE)
+                game_over_text = render_cached(self.font, 'Game Over! Space to restart', WHITE)
                 screen.blit(game_over_text, 
                            (WINDOW_WIDTH // 2 - game_over_text.get_width() // 2, 
                             WINDOW_HEIGHT // 2))
@@ -751,7 +954,12 @@ def main():
         running = game.handle_events()
         game.update()
         game.draw()
-        clock.tick(60)
+        if FLIP_WAITS_FOR_VSYNC:
+            # flip() already waits for the display; tick() just caps the frame-based physics at 60
+            clock.tick(60)
+        else:
+            # No vsync: tick() sleeps via SDL_Delay, which often overshoots; busy-wait for steadier 60 FPS
+            clock.tick_busy_loop(60)
 
     # Close DB connection cleanly
     try: